@@ -5,8 +5,6 @@
 import os
 import sys
 
-from setuptools_scm import get_version
-
 sys.path.insert(0, os.path.abspath('../'))
 
 # -- Project information -----------------------------------------------------
@@ -15,10 +13,25 @@ sys.path.insert(0, os.path.abspath('../'))
 project = 'LoggerML'
 copyright = '2023, Valentin Goldite'  # noqa A001
 author = 'Valentin Goldite'
+# Read the version written by setuptools_scm at build time (see
+# [tool.setuptools_scm] in pyproject.toml) and only fall back to a full
+# setuptools_scm invocation when the file is missing (e.g. raw checkout).
 try:
-    release = get_version()
-except:  # noqa E722
-    release = get_version(root='..', relative_to=__file__)
+    from logml._version import version as release
+except ImportError:
+    import functools
+
+    from setuptools_scm import get_version
+
+    @functools.cache
+    def _scm_version() -> str:
+        """Resolve the version with setuptools_scm, at most once per build."""
+        try:
+            return get_version()
+        except:  # noqa E722
+            return get_version(root='..', relative_to=__file__)
+
+    release = _scm_version()
 release = ".".join(release.split(".")[:3]) + ".dev" if "dev" in release else ""
 
 # -- General configuration ---------------------------------------------------
@@ -12,14 +12,41 @@ Copyright (C) 2023  Valentin Goldité
     DISTRIBUTION and PRIVATE USE as long as the original license is
     include as well as this copy right notice.
 """
-# pylint: disable=wrong-import-position
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
-from logml._version import __version__, __version_tuple__
+    from logml._version import __version__, __version_tuple__
+    from logml.logger import Logger
 
-RICH_CONSOLE = Console()
-
-from logml.logger import Logger  # noqa: E402
+    RICH_CONSOLE: Console
 
 __all__ = ["__version__", "__version_tuple__", "Logger", 'RICH_CONSOLE']
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the heavy attributes (PEP 562).
+
+    Building the shared rich Console (terminal probing), importing the
+    Logger machinery and reading the generated version file only on
+    first access keeps `import logml` essentially free.
+    """
+    if name in ("__version__", "__version_tuple__"):
+        from logml import _version
+
+        value = getattr(_version, name)
+        globals()[name] = value
+        return value
+    if name == "RICH_CONSOLE":
+        from rich.console import Console
+
+        console = Console()
+        globals()["RICH_CONSOLE"] = console
+        return console
+    if name == "Logger":
+        from logml.logger import Logger
+
+        globals()["Logger"] = Logger
+        return Logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
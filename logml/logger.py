@@ -1,9 +1,10 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Logger class."""
-import atexit
 import re
+import sys
 import time
-from typing import Any, Dict, Iterable, List, Optional, Union
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
 
 from rich.console import Group
 from rich.live import Live
@@ -16,6 +17,32 @@ from logml.time_utils import get_time_range, sec_to_timestr
 VarType = Union[int, float, str, bool]
 DictVarType = Union[Dict[str, int], Dict[str, float], Dict[str, str], Dict[str, bool]]
 
+# Compiled patterns cache: the same patterns are re-matched on every
+# log call so they are compiled exactly once for the process lifetime
+_PATTERN_CACHE: Dict[str, Pattern] = {}
+
+
+def _compile(pattern: str) -> Pattern:
+    """Compile a regex pattern with a module-level cache."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+
+# Exact-type lookup table: a single dict access replaces the two
+# isinstance calls for the common built-in types
+_KNOWN_NUMERIC = {int: True, float: True, bool: False, str: False}
+
+
+def _is_numeric(val: VarType) -> bool:
+    """Check whether the value is a non-bool number."""
+    numeric = _KNOWN_NUMERIC.get(type(val))
+    if numeric is None:
+        # Subclasses of int/float (e.g. numpy scalars) fall back here
+        return isinstance(val, (int, float)) and not isinstance(val, bool)
+    return numeric
+
 
 class Logger:
     """Logger class. Handles int, float, str and bool values.
@@ -84,6 +111,58 @@ class Logger:
         Current mean values (only numerical values).
     """
 
+    # Slots make the attribute accesses of the hot log path C-level
+    # offset fetches and shrink the per-logger memory footprint
+    __slots__ = (
+        "silent",
+        "name",
+        "show_bar",
+        "show_time",
+        "bold_keys",
+        "name_style",
+        "_default_styles",
+        "_default_sizes",
+        "_default_average",
+        "n_epochs",
+        "n_batches",
+        "log_interval",
+        "step",
+        "_glob_time",
+        "_epoch_time",
+        "current_epoch",
+        "current_batch",
+        "_on_tqdm",
+        "_just_new_epoch",
+        "vals",
+        "_counts",
+        "mean_vals",
+        "_timestr_cache",
+        "_time_info_key",
+        "_time_info_text",
+        "_name_cache",
+        "_epoch_batch_key",
+        "_epoch_batch_text",
+        "_bar_key",
+        "_bar_text",
+        "_cell_cache",
+        "_bold_style_cache",
+        "_kv_cache_key",
+        "_kv_cache_group",
+        "_last_refresh",
+        "_bars",
+        "_cycle_bars",
+        "console",
+        "live",
+        "_renderable",
+        "_prev_tables_list",
+        "_prev_table_width",
+        "_prev_row",
+        "_prev_flat_cell",
+        "_prev_message",
+        "_finalizer",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         n_epochs: int,
@@ -111,13 +190,19 @@ class Logger:
         self._default_styles = styles
         self._default_sizes = sizes
         self._default_average: Dict = {key: True for key in average} if average else {}
+        # Warm the pattern cache with the default config keys so the
+        # first log call does not pay for their compilation
+        for config in (styles, sizes, self._default_average):
+            if isinstance(config, dict):
+                for pattern in config:
+                    _compile(pattern)
         # Internal variables
         self.n_epochs = n_epochs
         self.n_batches = n_batches
         self.log_interval = log_interval
         self.step = 0
         self._glob_time = 0.0
-        self.start()  # Now, self._glob_time = time.time()
+        self.start()  # Now, self._glob_time = time.monotonic()
         self._epoch_time = 0.0
         self.current_epoch = 0
         self.current_batch = 0
@@ -127,23 +212,55 @@ class Logger:
         self.vals: Dict = {}  # Last vals called inside log
         self._counts: Dict = {}
         self.mean_vals: Dict = {}  # Current mean vals
-        # Rich elements
-        self.live = Live(
-            renderable=None,
-            console=RICH_CONSOLE,
-            refresh_per_second=4,
-            auto_refresh=False,
-        )
-        self._renderable = None
+        # Time strings cache (integer second -> formatted string)
+        self._timestr_cache: Dict[int, str] = {}
+        # Time info line cache (epoch, batch, second -> text)
+        self._time_info_key: Optional[tuple] = None
+        self._time_info_text = Text("")
+        # Caches of the other static parts of the frame
+        self._name_cache: tuple = (None, None, Text(""))
+        self._epoch_batch_key: Optional[tuple] = None
+        self._epoch_batch_text = Text("")
+        self._bar_key = ""
+        self._bar_text = Text("")
+        # Formatted cells cache of the keys/values tables
+        self._cell_cache: Dict[tuple, Text] = {}
+        # Bolded key styles cache (style -> style + " bold")
+        self._bold_style_cache: Dict[VarType, str] = {}
+        # Keys/values group cache for identical calls in the same batch
+        self._kv_cache_key: Optional[tuple] = None
+        self._kv_cache_group = Group()
+        # Monotonic time of the last forced terminal refresh
+        self._last_refresh = 0.0
+        # Precomputed progress bar strings (percent -> bar) and cycling
+        # bar strings for the unknown-n_batches case (position -> bar)
+        self._bars: List[str] = []
+        for progress in range(101):
+            arrow_len = int(47 * progress / 100)
+            arrowhead = ">" if arrow_len < 47 else "="
+            self._bars.append(
+                f"[{'=' * arrow_len}{arrowhead}{' ' * (47 - arrow_len)}]"
+                f"[{progress:3d}%]"
+            )
+        self._cycle_bars: List[str] = []
+        for pos in range(54):
+            bar_list = [" "] * 54
+            for i in range(3):
+                bar_list[(pos + i) % 54] = "="
+            self._cycle_bars.append(f"[{''.join(bar_list)}]")
+        # Rich elements (the finalizer forcing the live display to end
+        # when the logger is collected is bound by _make_live and does
+        # not keep the logger alive, unlike atexit.register(self.stop))
         self.console = RICH_CONSOLE
+        self._finalizer = None
+        self.live = self._make_live()
+        self._renderable = None
         # Table and message infos from the previous log of the same batch
         self._prev_tables_list: List[Table] = []
         self._prev_table_width = 0
         self._prev_row: List[Text] = []
         self._prev_flat_cell = True
         self._prev_message = ""
-        # Force live display to end at exit
-        atexit.register(self.stop)
 
     def log(
         self,
@@ -153,6 +270,7 @@ class Logger:
         styles: Union[Dict[str, str], str, None] = None,
         sizes: Union[Dict[str, int], int, None] = None,
         average: Optional[List[str]] = None,
+        update_on_skip: bool = True,
     ) -> None:
         """Log the values with style.
 
@@ -182,19 +300,82 @@ class Logger:
         average : Optional[List[str]], optional
             List of the values to average over the epoch.
             None to not average. By default None.
+        update_on_skip : bool, optional
+            Whether to update the internal values on the calls that are
+            not rendered because of the log interval. Disabling it skips
+            all work on such calls, at the price of means computed from
+            the rendered batches only. By default True.
         """
         self._prelog_check()
-        # Update internal values
+        # Skip everything on non-rendered calls if requested
+        if not update_on_skip and not self._should_refresh():
+            return
+        # Update internal values with the dicts hoisted to locals: this
+        # loop is the hottest path of the module. Interned keys hit the
+        # pointer-equality fast path of every later dict lookup, and the
+        # incremental (Welford) mean is cheaper and numerically more
+        # stable than re-computing (mean * (n-1) + val) / n.
+        counts, mean_vals, vals = self._counts, self.mean_vals, self.vals
         for key, val in values.items():
-            self._update_val(key, val)
-        # Never log if silent
+            key = sys.intern(key)
+            count = counts.get(key, 0) + 1
+            counts[key] = count
+            if isinstance(val, (int, float)):
+                mean = mean_vals.get(key, 0)
+                mean_vals[key] = mean + (val - mean) / count
+            else:
+                mean_vals.setdefault(key, 0)
+            vals[key] = val
+        # Never log if silent: the values and means are only tracked
         if self.silent:
             return
 
-        # Update the live display
+        # Skip the whole renderable construction when this call will
+        # neither be drawn now nor picked up by the auto-refresh thread
+        refresh = self._should_refresh()
+        if not refresh and not self.live.auto_refresh:
+            return
+        if refresh and not self.live.auto_refresh:
+            # Coalesce bursts of qualifying calls into at most
+            # refresh_per_second real terminal writes: the frame is still
+            # stored in the Live but not flushed. First and last batches
+            # are always drawn.
+            now = time.monotonic()
+            if (
+                now - self._last_refresh < 1 / self.live.refresh_per_second
+                and self.current_batch != 1
+                and self.current_batch != self.n_batches
+            ):
+                refresh = False
+            else:
+                self._last_refresh = now
+
+        # Build the frame and update the live display
+        # NOTE: the Live background thread paces the rendering itself
+        # when auto refresh is enabled (no log interval)
+        self._renderable = self._build_group(
+            values,
+            message=message,
+            styles=styles,
+            sizes=sizes,
+            average=average,
+        )
+        self.live.update(
+            renderable=self._renderable,
+            refresh=refresh and not self.live.auto_refresh,
+        )
 
+    def _build_group(
+        self,
+        values: Dict[str, VarType],
+        *,
+        message: str,
+        styles: Union[Dict[str, str], str, None],
+        sizes: Union[Dict[str, int], int, None],
+        average: Optional[List[str]],
+    ) -> Group:
+        """Build the full renderable group of a log call."""
         renderables = []
-
         # Add Name (if exists)
         if self.name:
             renderables.append(self._build_name())
@@ -205,7 +386,7 @@ class Logger:
             renderables.append(self._build_bar())
         # Build time info (if activated)
         if self.show_time:
-            renderables.append(self._build_time_info())
+            renderables.append(self._build_time_info(time.monotonic()))
         # Build keys and values table
         if len(values) > 0:
             average_dict = {key: True for key in average} if average else {}
@@ -219,21 +400,7 @@ class Logger:
         # Build message (if exists)
         if message or self._prev_message:
             renderables.append(self._build_message(message))
-
-        # Create renderable group and update the live display
-        self._renderable = Group(*renderables)
-        refresh = (
-            # auto refresh regularly if no log interval
-            self.log_interval is None
-            # refresh at log intervals
-            or self.current_batch % self.log_interval == 0
-            # refresh at first batch
-            or self.current_batch == 1
-            # refresh at last batch (if n_batches is specified)
-            or (self.n_batches and self.current_batch == self.n_batches)
-        )
-
-        self.live.update(renderable=self._renderable, refresh=refresh)
+        return Group(*renderables)
 
     def tqdm(
         self,
@@ -286,22 +453,25 @@ class Logger:
         if reset_means:
             self._counts = {key: 0 for key in self._counts}
             self.mean_vals = {key: 0 for key in self.mean_vals}
-        self.live = Live(
-            renderable=None,
-            console=RICH_CONSOLE,
-            refresh_per_second=4,
-            auto_refresh=False,
-        )
-        self._renderable = None
-        # "Detach" the logs from the previous epoch
+        # "Detach" the logs from the previous epoch before clearing the
+        # renderable, so its last frame stays visible in the terminal
         self.detach()
+        # Reuse the same Live across epochs (it is restarted below);
+        # only rebuild it if the refresh mode must change
+        if self.live.auto_refresh != (self.log_interval is None):
+            self.live = self._make_live()
+        else:
+            self.live.update(renderable=None, refresh=False)
+        self._renderable = None
         # Update epoch and batch
         self.current_epoch += 1
         self.current_batch = 0
-        # Start the new live display
-        self.live.start()
+        # Start the new live display (never rendered when silent, so the
+        # Live machinery is not started at all in that case)
+        if not self.silent:
+            self.live.start()
         # Set the new epoch start time
-        self._epoch_time = time.time()
+        self._epoch_time = time.monotonic()
 
     def start_epoch(self, *, reset_means: bool = True) -> None:
         """Declare a new epoch. Alias for :meth:`new_epoch`."""
@@ -321,6 +491,7 @@ class Logger:
         self._prev_row = []
         self._prev_flat_cell = True
         self._prev_message = ""
+        self._kv_cache_key = None
 
     def start_batch(self) -> None:
         """Declare a new batch. Alias for :meth:`new_batch`."""
@@ -360,13 +531,13 @@ class Logger:
 
     def start(self) -> None:
         """Set the start time of the training (already called at initialization)."""
-        self._glob_time = time.time()
+        self._glob_time = time.monotonic()
 
     def reset(self) -> None:
         """Reset the logger as at initialization."""
         self.stop()
         self.step = 0
-        self._glob_time = time.time()
+        self._glob_time = time.monotonic()
         self._epoch_time = 0.0
         self.current_epoch = 0
         self.current_batch = 0
@@ -374,18 +545,16 @@ class Logger:
         self.vals = {}
         self.mean_vals = {}
         self._counts = {}
-        self.live = Live(
-            renderable=None,
-            console=RICH_CONSOLE,
-            refresh_per_second=4,
-            auto_refresh=False,
-        )
+        self._time_info_key = None
+        self.live = self._make_live()
         self._renderable = None
         self._prev_tables_list = []
         self._prev_table_width = 0
         self._prev_row = []
         self._prev_flat_cell = True
         self._prev_message = ""
+        self._kv_cache_key = None
+        self._last_refresh = 0.0
 
     def get_vals(self, *, average: Optional[List[str]] = None) -> Dict[str, VarType]:
         """Get the last values called with log, optionally averaged.
@@ -401,18 +570,50 @@ class Logger:
         Dict[str, VarType]
             Last values called with log (optionally averaged).
         """
-        if average is None:
-            average = []
+        if not average:
+            # No averaging requested: skip the per-key pattern scan
+            return self.vals.copy()
         vals = self.vals.copy()
         for key in vals:
             if key in average:
                 vals[key] = self.mean_vals[key]
             else:
                 for pattern in average:
-                    if re.match(pattern, key):
+                    if _compile(pattern).match(key):
                         vals[key] = self.mean_vals[key]
         return vals
 
+    def _make_live(self) -> Live:
+        """Create a new Live display bound to the shared console.
+
+        The garbage-collection finalizer is rebound to the new Live so
+        it only ever stops this logger's own display, never whatever
+        display is currently attached to the shared console.
+        """
+        live = Live(
+            renderable=None,
+            console=self.console,
+            refresh_per_second=4,
+            auto_refresh=self.log_interval is None,
+        )
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        self._finalizer = weakref.finalize(self, _stop_live, live)
+        return live
+
+    def _should_refresh(self) -> bool:
+        """Check whether the current batch qualifies for a display refresh."""
+        return (
+            # refresh on every call if no log interval
+            self.log_interval is None
+            # refresh at log intervals
+            or self.current_batch % self.log_interval == 0
+            # refresh at first batch
+            or self.current_batch == 1
+            # refresh at last batch (if n_batches is specified)
+            or bool(self.n_batches and self.current_batch == self.n_batches)
+        )
+
     def _prelog_check(self) -> None:
         """Check if the logger is ready to log."""
         err_message = ""
@@ -433,65 +634,69 @@ class Logger:
             )
             raise ValueError(err_message)
 
-    def _update_val(self, key: str, val: VarType) -> None:
-        """Update the internal values."""
-        if key not in self._counts:
-            self._counts[key] = 0
-        if key not in self.mean_vals:
-            self.mean_vals[key] = 0
-        self._counts[key] += 1
-        if isinstance(val, (int, float)):
-            mean = (self.mean_vals[key] * (self._counts[key] - 1) + val) / self._counts[
-                key
-            ]
-            self.mean_vals[key] = mean
-        self.vals[key] = val
-
     def _build_name(self) -> Text:
-        """Build the name of the logger."""
-        return Text(text=self.name, style=self.name_style)
+        """Build the name of the logger (cached while unchanged)."""
+        if self._name_cache[:2] != (self.name, self.name_style):
+            self._name_cache = (
+                self.name,
+                self.name_style,
+                Text(text=self.name, style=self.name_style),
+            )
+        return self._name_cache[2]
 
     def _build_epoch_batch(self) -> Text:
-        """Build a text containing epoch and batch info."""
-        if self.n_batches is not None:
-            return Text(
-                f"Epoch {self.current_epoch}/{self.n_epochs}, "
-                f"batch {self.current_batch}/{self.n_batches}",
-            )
-        # Unknown number of batches
-        return Text(
-            f"Epoch {self.current_epoch}/{self.n_epochs}, "
-            f"batch {self.current_batch}",
-        )
+        """Build a text containing epoch and batch info (cached per batch)."""
+        key = (self.current_epoch, self.n_epochs, self.current_batch, self.n_batches)
+        if key != self._epoch_batch_key:
+            self._epoch_batch_key = key
+            if self.n_batches is not None:
+                self._epoch_batch_text = Text(
+                    f"Epoch {self.current_epoch}/{self.n_epochs}, "
+                    f"batch {self.current_batch}/{self.n_batches}",
+                )
+            else:
+                # Unknown number of batches
+                self._epoch_batch_text = Text(
+                    f"Epoch {self.current_epoch}/{self.n_epochs}, "
+                    f"batch {self.current_batch}",
+                )
+        return self._epoch_batch_text
 
     def _build_bar(self) -> Text:
         """Build a text containing a custom progress bar."""
         if self.n_batches is not None:
             progress = min(100, int(100 * self.current_batch / self.n_batches))
-            arrow_len = int(47 * progress / 100)
-            arrowhead = ">" if arrow_len < 47 else "="
-            return Text(
-                f"[{'=' * arrow_len}{arrowhead}{' ' * (47-arrow_len)}]"
-                f"[{progress:3d}%]",
-                overflow="ellipsis",
-            )
-        # NOTE: We don't know the number of batches, so we just print
-        # a bar that cycles every 20 log intervals or every 100 batches
-        # if log_interval is None.
-        if self.log_interval:
-            progress = (self.step // self.log_interval) % 20
-            arrow_len = int(54 * progress / 19)
+            bar_str = self._bars[progress]
         else:
-            arrow_len = int(54 * (self.step % 100) / 99)
-        bar_list = [" "] * 54
-        for i in range(3):
-            bar_list[(arrow_len + i) % 54] = "="
-        return Text(f"[{''.join(bar_list)}]", overflow="ellipsis")
-
-    def _build_time_info(self) -> Text:
-        """Build time info text."""
+            # NOTE: We don't know the number of batches, so we just print
+            # a bar that cycles every 20 log intervals or every 100 batches
+            # if log_interval is None.
+            if self.log_interval:
+                progress = (self.step // self.log_interval) % 20
+                arrow_len = int(54 * progress / 19)
+            else:
+                arrow_len = int(54 * (self.step % 100) / 99)
+            bar_str = self._cycle_bars[arrow_len % 54]
+        # The Text is only rebuilt when the bar visually moves
+        if bar_str != self._bar_key:
+            self._bar_key = bar_str
+            self._bar_text = Text(bar_str, overflow="ellipsis")
+        return self._bar_text
+
+    def _build_time_info(self, current_time: float) -> Text:
+        """Build time info text from the current (monotonic) time."""
+        # Reuse the previous text when neither the progress nor the time
+        # bucket has moved since the last call. The bucket matches the
+        # 4 Hz display refresh rate so the ETA stays fresh at that pace.
+        cache_key = (
+            self.current_epoch,
+            self.current_batch,
+            int((current_time - self._glob_time) * 4),
+        )
+        if cache_key == self._time_info_key:
+            return self._time_info_text
         (delta_glob, delta_epoch, eta_glob, eta_epoch) = get_time_range(
-            current_time=time.time(),
+            current_time=current_time,
             start_glob=self._glob_time,
             start_epoch=self._epoch_time,
             current_epoch=self.current_epoch,
@@ -499,15 +704,34 @@ class Logger:
             n_epochs=self.n_epochs,
             n_batches=self.n_batches,
         )
-        delta_glob_str = sec_to_timestr(delta_glob)
-        delta_epoch_str = sec_to_timestr(delta_epoch)
-        eta_glob_str = sec_to_timestr(eta_glob) if eta_glob is not None else " ? "
-        eta_epoch_str = sec_to_timestr(eta_epoch) if eta_epoch is not None else " ? "
+        delta_glob_str = self._sec_to_timestr_cached(delta_glob)
+        delta_epoch_str = self._sec_to_timestr_cached(delta_epoch)
+        eta_glob_str = self._sec_to_timestr_cached(eta_glob)
+        eta_epoch_str = self._sec_to_timestr_cached(eta_epoch)
         time_str = (
             f"[global {delta_glob_str} < {eta_glob_str} | "
             f"epoch {delta_epoch_str} < {eta_epoch_str}]"
         )
-        return Text(time_str, overflow="ellipsis")
+        self._time_info_key = cache_key
+        self._time_info_text = Text(time_str, overflow="ellipsis")
+        return self._time_info_text
+
+    def _sec_to_timestr_cached(self, sec: Optional[float]) -> str:
+        """Get the time string of a duration, cached on the integer second.
+
+        Sub-second logs hit the cache as long as the displayed time has
+        not changed. Return " ? " if the duration is unavailable.
+        """
+        if sec is None:
+            return " ? "
+        sec_int = int(sec)
+        timestr = self._timestr_cache.get(sec_int)
+        if timestr is None:
+            timestr = sec_to_timestr(sec)
+            if len(self._timestr_cache) > 1024:
+                self._timestr_cache.clear()
+            self._timestr_cache[sec_int] = timestr
+        return timestr
 
     def _build_keys_vals(
         self,
@@ -518,6 +742,18 @@ class Logger:
         average: Union[Dict[str, bool], bool],
     ) -> Group:
         """Build a group of tables containing the keys and values."""
+        # Identical consecutive calls of the same batch reuse the cached
+        # group (only without averaging: averaged values move every call)
+        if not average and not self._default_average:
+            kv_key: Optional[tuple] = (
+                tuple(values.items()),
+                _freeze_config(styles),
+                _freeze_config(sizes),
+            )
+            if kv_key == self._kv_cache_key:
+                return self._kv_cache_group
+        else:
+            kv_key = None
         # flat_cell = True => log "key: value"
         # flat_cell = False => log "key \n value"
         if not self._prev_tables_list:
@@ -528,54 +764,65 @@ class Logger:
             # Previous logged values in same epoch => keep same flat_cell
             flat_cell = self._prev_flat_cell
 
+        # Resolve style, size and average bool of every key in one pass
+        res_styles = self._resolve_params(
+            values, styles, self._default_styles, default_value=""
+        )
+        res_sizes = self._resolve_params(
+            values, sizes, self._default_sizes, default_value=6
+        )
+        res_average = self._resolve_params(
+            values, average, self._default_average, default_value=False
+        )
+
         # The row contains all the values of the last table (if any)
         tables_list = self._prev_tables_list[:-1]
         row = self._prev_row
         table_width = self._prev_table_width
+        console_width = self.console.width
 
         # New table
         tables_list.append(Table(show_header=False, show_edge=False))
 
         for key, val in values.items():
             # Get style, size and average bool
-            style = self._get_param(
-                key,
-                styles,
-                self._default_styles,
-                default_value="",
-            )
-            size = self._get_param(key, sizes, self._default_sizes, default_value=6)
-            avg = self._get_param(
-                key, average, self._default_average, default_value=False
-            )
+            style = res_styles[key]
+            size = res_sizes[key]
+            avg = res_average[key]
             # Format value and get average if needed
-            if isinstance(val, (int, float)) and not isinstance(val, bool):
+            if _is_numeric(val):
                 if avg:
                     val = self.mean_vals[key]
-                val = str(val)
-                # Keep exp notation if needed
-                exp_ind = val.index("e") if "e" in val else len(val)
-                size = min(int(size), exp_ind)
-                val = val[:size].ljust(size) + val[exp_ind:]
+                val_str = _format_num(val, int(size))
+            else:
+                val_str = val if isinstance(val, str) else str(val)
             # cell_width: expected length of the cell to be shown
             if flat_cell:
-                cell_width = 3 + len(str(key)) + len(str(val))
+                cell_width = 3 + len(key) + len(val_str)
             else:
-                cell_width = 3 + max(len(str(key)), len(str(val)))
+                cell_width = 3 + max(len(key), len(val_str))
             # Create a new table when the current table is too wide
-            if table_width + cell_width > self.console.width:
+            if table_width + cell_width > console_width:
                 tables_list[-1].add_row(*row)
                 tables_list.append(Table(show_header=False, show_edge=False))
                 table_width = 0
                 row = []
-            cell = Text(justify="center")
-            # Add key and value on the cell
-            key_style = str(style) + " bold" if self.bold_keys else style
-            cell.append(str(key), style=key_style)
-            if flat_cell:
-                cell.append(": " + str(val), style=style)
-            else:
-                cell.append("\n" + str(val), style=style)
+            # Reuse the cell built on a previous log when key, value and
+            # styling are identical (frequent with multi-log steps)
+            cell_key = (key, val_str, style, flat_cell, self.bold_keys)
+            cell = self._cell_cache.get(cell_key)
+            if cell is None:
+                cell = Text(justify="center")
+                # Add key and value on the cell
+                key_style = self._bold_style(style) if self.bold_keys else style
+                cell.append(key, style=key_style)
+                if flat_cell:
+                    cell.append(": " + val_str, style=style)
+                else:
+                    cell.append("\n" + val_str, style=style)
+                if len(self._cell_cache) > 2048:
+                    self._cell_cache.clear()
+                self._cell_cache[cell_key] = cell
             row.append(cell)
             table_width += cell_width
         # Add the last row
@@ -585,30 +832,44 @@ class Logger:
         self._prev_table_width = table_width
         self._prev_row = row
         self._prev_flat_cell = flat_cell
-        return Group(*tables_list)
+        self._kv_cache_key = kv_key
+        self._kv_cache_group = Group(*tables_list)
+        return self._kv_cache_group
+
+    def _bold_style(self, style: VarType) -> str:
+        """Get the bolded version of a value style (cached)."""
+        bold = self._bold_style_cache.get(style)
+        if bold is None:
+            bold = self._bold_style_cache[style] = str(style) + " bold"
+        return bold
 
     @staticmethod
-    def _get_param(
-        key: str,
+    def _resolve_params(
+        keys: Iterable[str],
         log_configs: Union[DictVarType, VarType, None],
         default_configs: Union[DictVarType, VarType],
         *,
         default_value: VarType,
-    ) -> VarType:
-        """Get the parameter for the key on log_configs or default_configs."""
+    ) -> Dict[str, VarType]:
+        """Get the parameter of each key on log_configs or default_configs.
+
+        The nature of the configs (single value or dict) is detected once
+        for all the keys instead of once per key.
+        """
         if isinstance(log_configs, (int, float, str, bool)):
-            return log_configs
-        if log_configs is not None:  # logs_configs is a dict
-            val = _regex_looking(key, log_configs)
-            if val:
-                return val
-        # logs_configs is None => use default_configs
-        if isinstance(default_configs, (int, float, str, bool)):
-            return default_configs
-        val = _regex_looking(key, default_configs)
-        if val:
-            return val
-        return default_value
+            return dict.fromkeys(keys, log_configs)
+        log_is_dict = log_configs is not None
+        default_is_single = isinstance(default_configs, (int, float, str, bool))
+        resolved: Dict[str, VarType] = {}
+        for key in keys:
+            val = _regex_looking(key, log_configs) if log_is_dict else None
+            if not val:
+                if default_is_single:
+                    val = default_configs  # type: ignore
+                else:
+                    val = _regex_looking(key, default_configs) or default_value
+            resolved[key] = val
+        return resolved
 
     def _build_message(self, message: str) -> Text:
         """Build message."""
@@ -620,12 +881,38 @@ class Logger:
         return Text(message, justify="left")
 
 
+def _freeze_config(config: Union[DictVarType, VarType, None]) -> Any:
+    """Get a hashable identity of a (possibly dict) log config."""
+    if isinstance(config, dict):
+        return tuple(config.items())
+    return config
+
+
+def _stop_live(live: Live) -> None:
+    """Stop a logger's own live display (finalizer callback)."""
+    if live.is_started:
+        live.stop()
+    elif live.console._live is live:  # pylint: disable=protected-access
+        live.console.clear_live()
+
+
+def _format_num(val: Union[int, float], size: int) -> str:
+    """Format a number on at most `size` characters, keeping exp notation."""
+    if size <= 0:
+        return ""
+    val_str = str(val)
+    # Keep exp notation if needed
+    exp_ind = val_str.index("e") if "e" in val_str else len(val_str)
+    size = min(size, exp_ind)
+    return val_str[:size] + val_str[exp_ind:]
+
+
 def _regex_looking(key: str, config: DictVarType) -> Optional[VarType]:
     """Look on config (dict) for pattern matching and return the value."""
     if key in config:
         return config[key]
     val = None
     for pattern in config:
-        if re.match(pattern, key):
+        if _compile(pattern).match(key):
             val = config[pattern]
     return val
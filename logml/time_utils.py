@@ -1,16 +1,28 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Utilities for time data."""
+import functools
 from typing import Optional, Tuple
 
 
+# Zero-padded two-digit strings, indexed by value (avoids the format
+# machinery for the minutes/seconds fields)
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_sec(sec_int: int) -> str:
+    """Format a positive integer number of seconds (cached)."""
+    minutes, seconds = divmod(sec_int, 60)
+    hours, minutes = divmod(minutes, 60)
+    hours_str = _TWO_DIGIT[hours] if hours < 100 else str(hours)
+    return f"{hours_str}:{_TWO_DIGIT[minutes]}:{_TWO_DIGIT[seconds]}"
+
+
 def sec_to_timestr(sec: float) -> str:
     """Return a string corresponding to the time given in seconds."""
     if sec <= 0.0:
-        timestr = "00:00:00"
-    else:
-        sec_int = int(sec)
-        timestr = f"{sec_int // 3600:02d}:{sec_int % 3600 // 60:02d}:{sec_int % 60:02d}"
-    return timestr
+        return "00:00:00"
+    return _fmt_sec(int(sec))
 
 
 def get_time_range(
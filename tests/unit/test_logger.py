@@ -96,6 +96,41 @@ def test_internal_values() -> None:
     logger.stop()
 
 
+def test_update_on_skip() -> None:
+    """Test the update_on_skip parameter of log."""
+    logger = Logger(n_epochs=1, n_batches=4, log_interval=2)
+    logger.new_epoch()
+    logger.new_batch()  # rendered (first batch)
+    logger.log({"loss": 1.0}, update_on_skip=False)
+    check.equal(logger.vals["loss"], 1.0)
+    check.equal(logger.mean_vals["loss"], 1.0)
+    logger.new_batch()  # rendered (log interval)
+    logger.log({"loss": 0.5}, update_on_skip=False)
+    check.equal(logger.vals["loss"], 0.5)
+    check.equal(logger.mean_vals["loss"], 0.75)
+    logger.new_batch()  # skipped: the internal values must not move
+    logger.log({"loss": 0.0}, update_on_skip=False)
+    check.equal(logger.vals["loss"], 0.5)
+    check.equal(logger.mean_vals["loss"], 0.75)
+    logger.stop()
+
+
+def test_epoch_frames(capsys: pytest.CaptureFixture) -> None:
+    """Test that each epoch persists its last frame."""
+    capsys.readouterr()
+    logger = Logger(2, 2, name="Frames")
+    for _ in range(2):
+        logger.new_epoch()
+        for _ in range(2):
+            logger.new_batch()
+            logger.log({"loss": 0.5})
+    logger.stop()
+    captured = capsys.readouterr()
+    # On a non-terminal console, exactly one frame per epoch is printed
+    check.equal(captured.out.count("Epoch 1/2"), 1)
+    check.equal(captured.out.count("Epoch 2/2"), 1)
+
+
 def test_silent(capsys: pytest.CaptureFixture) -> None:
     """Test silent logger."""
     captured = capsys.readouterr()
@@ -107,6 +142,10 @@ def test_silent(capsys: pytest.CaptureFixture) -> None:
             logger.log({"loss": 0.02})
     captured = capsys.readouterr()
     check.equal(captured.out, "")
+    # The values and means remain tracked for programmatic access
+    check.equal(logger.vals["loss"], 0.02)
+    check.equal(logger.mean_vals["loss"], 0.02)
+    check.equal(logger.get_vals(average=["loss"]), {"loss": 0.02})
 
 
 def test_tqdm() -> None: